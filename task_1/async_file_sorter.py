@@ -10,6 +10,7 @@ Rules:
 - Known service dirs are excluded: .git, .idea, node_modules, __pycache__.
 - No extension or "non-sensical" extensions (numeric/garbage) go to 'no_extension/'.
 - Multi-suffix archives like '.tar.gz' are grouped as 'tar.gz/'.
+- Symlinked files are copied (their target's contents); symlinked dirs are not followed.
 
 Usage:
     python async_file_sorter.py --source /path/to/source --output /path/to/output
@@ -20,13 +21,40 @@ from __future__ import annotations
 import argparse
 import asyncio
 import logging
+import os
+import queue
 import shutil
+import sys
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Optional, Set
+from typing import Callable, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+try:  # Not available on Windows
+    import fcntl
+    _HAVE_FCNTL = True
+except ImportError:  # pragma: no cover
+    _HAVE_FCNTL = False
+
+try:  # Optional faster event loop
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is not available everywhere
+    uvloop = None
 
 
 # Explicitly excluded directories
-EXCLUDED_DIRS: Set[str] = {".git", ".idea", "node_modules", "__pycache__"}
+EXCLUDED_DIRS: FrozenSet[str] = frozenset({".git", ".idea", "node_modules", "__pycache__"})
+
+# Allowed numeric-first formats
+_ALLOW_NUMERIC_ONLY: FrozenSet[str] = frozenset({"7z", "3gp", "3g2"})
+
+# Max bytes per os.copy_file_range / os.sendfile call
+_COPY_CHUNK = 1 << 20
+
+# ioctl request number for FICLONE (Linux reflink)
+_FICLONE = 0x40049409
 
 
 def setup_logging() -> None:
@@ -38,122 +66,314 @@ def setup_logging() -> None:
     )
 
 
-def _extension_folder_name(path: Path) -> str:
+def _extension_folder_name(name: str) -> str:
     """
     Determine destination subfolder name based on file extension.
 
+    Args:
+        name: File name (without directories).
+
+    Returns:
+        A string with the normalized extension or 'no_extension'.
+    """
+    # Same splitting rules as PurePath.suffixes, without building a Path
+    if name.endswith("."):
+        return _folder_for_suffixes(())
+    suffixes = name.lstrip(".").split(".")[1:]
+    return _folder_for_suffixes(tuple("." + s for s in suffixes))
+
+
+def _has_letter(text: str) -> bool:
+    """Return True if an alphanumeric 'text' contains at least one letter."""
+    if text.isascii():
+        # For ASCII, alphanumeric minus digits (and dots) means letters
+        return not text.replace(".", "").isdigit()
+    return any(ch.isalpha() for ch in text)
+
+
+@lru_cache(maxsize=1024)
+def _folder_for_suffixes(suffixes: Tuple[str, ...]) -> str:
+    """
+    Map a tuple of file suffixes to a destination subfolder name (cached).
+
     Rules:
     - Multi-suffix extensions (e.g., '.tar.gz') become 'tar.gz'.
     - Accept alphanumeric parts (letters and/or digits).
     - Reject purely numeric or garbage extensions (e.g., '.000000002') -> 'no_extension'.
     - Allow certain known numeric-first formats (e.g., '7z', '3gp', '3g2').
-
-    Args:
-        path: Path object for the file.
-
-    Returns:
-        A string with the normalized extension or 'no_extension'.
     """
     # Extract all suffix parts without leading dots, lowercased
-    parts = [s.lstrip(".").lower() for s in path.suffixes]  # e.g. ['tar', 'gz'] for .tar.gz
+    parts = [s.lstrip(".").lower() for s in suffixes]  # e.g. ['tar', 'gz'] for .tar.gz
     if not parts:
         return "no_extension"
 
     joined = ".".join(parts)
 
-    # Allowed numeric-first formats
-    allow_numeric_only = {"7z", "3gp", "3g2"}
-
     # All parts must be alphanumeric (letters and/or digits)
     if all(p.isalnum() for p in parts):
         # At least one part should contain a letter OR be in the allowlist
-        if any(any(ch.isalpha() for ch in p) for p in parts) or joined in allow_numeric_only:
+        if joined in _ALLOW_NUMERIC_ONLY or _has_letter(joined):
             return joined
 
     return "no_extension"
 
 
-def _should_skip(path: Path) -> bool:
-    """Return True if the path should be skipped based on hidden/excluded dirs."""
-    # Skip hidden files/dirs anywhere in the path
-    if any(part.startswith(".") for part in path.parts):
-        return True
-    # Skip explicitly excluded directories
-    if any(part in EXCLUDED_DIRS for part in path.parts):
-        return True
+def _should_skip(name: str) -> bool:
+    """Return True for hidden files/dirs and explicitly excluded directories."""
+    return name.startswith(".") or name in EXCLUDED_DIRS
+
+
+def _scan_tree(
+    root: Path,
+    on_file: Callable[[os.DirEntry], None],
+    workers: int,
+    stop: Optional[threading.Event] = None,
+    skip_dirs: FrozenSet[str] = frozenset(),
+) -> None:
+    """
+    Scan 'root' with several os.scandir threads, calling 'on_file' per file.
+
+    Directories are shared through a queue, so listings of sibling directories
+    overlap (helps on network/high-latency storage). Hidden and excluded
+    directories are pruned before descending into them. Symlinks to
+    directories are not followed (avoids loops); symlinks to files are
+    reported like regular files, so their target gets copied. 'on_file' is called from the scan threads. Setting 'stop'
+    ends the scan early. Directories whose absolute path is in 'skip_dirs'
+    are pruned too.
+    """
+    dir_q: "queue.Queue[Optional[str]]" = queue.Queue()
+    dir_q.put(os.path.abspath(root))
+    # Also set on the first unexpected error (e.g. 'on_file' failing because
+    # the event loop was closed): workers then only drain the queue so
+    # dir_q.join() can still return
+    stop = stop if stop is not None else threading.Event()
+    errors: List[BaseException] = []
+
+    def scan_worker() -> None:
+        while True:
+            current = dir_q.get()
+            if current is None:
+                return
+            try:
+                if stop.is_set():
+                    continue
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if stop.is_set():
+                            break
+                        if _should_skip(entry.name):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.path not in skip_dirs:
+                                dir_q.put(entry.path)
+                        elif entry.is_file():
+                            on_file(entry)
+            except OSError as exc:
+                logging.error("Failed to scan %s: %s", current, exc)
+            except Exception as exc:
+                if not stop.is_set():
+                    errors.append(exc)
+                    stop.set()
+            finally:
+                dir_q.task_done()
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(scan_worker) for _ in range(workers)]
+        # Every directory is marked done only after its subdirectories are queued
+        dir_q.join()
+        for _ in futures:
+            dir_q.put(None)
+        for future in futures:
+            future.result()
+
+    if errors:
+        raise errors[0]
+
+
+def _reflink(in_fd: int, out_fd: int) -> bool:
+    """Clone file extents with ioctl(FICLONE); True on success (btrfs, XFS, ...)."""
+    if not _HAVE_FCNTL or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.ioctl(out_fd, _FICLONE, in_fd)
+    except OSError:
+        return False
+    return True
+
+
+def _kernel_copy(in_fd: int, out_fd: int) -> bool:
+    """
+    Copy file contents inside the kernel with copy_file_range or sendfile.
+
+    Returns False if neither call is usable for this pair of files (nothing
+    has been written yet in that case); errors after a partial copy are raised.
+    """
+    copiers = []
+    if hasattr(os, "copy_file_range"):
+        copiers.append(lambda offset: os.copy_file_range(
+            in_fd, out_fd, _COPY_CHUNK, offset, offset))
+    if hasattr(os, "sendfile"):
+        copiers.append(lambda offset: os.sendfile(out_fd, in_fd, offset, _COPY_CHUNK))
+
+    for copy_chunk in copiers:
+        offset = 0
+        try:
+            while True:
+                copied = copy_chunk(offset)
+                if copied == 0:
+                    if offset:
+                        return True
+                    # Some filesystems report 0 for non-empty files: give up
+                    # on this copier (empty files end up in shutil.copyfile)
+                    break
+                offset += copied
+        except OSError:
+            # Not supported for these files (e.g. cross-device, old kernel)
+            if offset:
+                raise
     return False
 
 
-async def _copy_file_async(src: Path, dst_dir: Path) -> None:
+def _copy_one(src: str, dst: str) -> None:
+    """
+    Copy a file with the cheapest available method, then copy metadata.
+
+    Tries a reflink clone first, then an in-kernel copy, and finally falls
+    back to shutil.copyfile. Metadata is preserved like shutil.copy2.
+    """
+    with open(src, "rb") as fsrc:
+        in_fd = fsrc.fileno()
+        # Open without O_TRUNC: 'dst' must not be emptied if it is 'src' itself
+        out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o666)
+        with os.fdopen(out_fd, "wb") as fdst:
+            in_st, out_st = os.fstat(in_fd), os.fstat(out_fd)
+            if (in_st.st_dev, in_st.st_ino) == (out_st.st_dev, out_st.st_ino):
+                raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+            os.ftruncate(out_fd, 0)
+            copied = _reflink(in_fd, out_fd) or _kernel_copy(in_fd, out_fd)
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+async def _copy_file_async(src: str, dst: str, pool: Executor) -> None:
     """
-    Copy a single file into 'dst_dir' asynchronously (offloaded to a thread).
+    Copy a single file to 'dst' asynchronously (offloaded to 'pool').
 
-    Uses shutil.copy2 to preserve metadata.
+    The destination directory must already exist. Preserves metadata like
+    shutil.copy2.
     """
     try:
-        dst_dir.mkdir(parents=True, exist_ok=True)
-        dst = dst_dir / src.name
-        await asyncio.to_thread(shutil.copy2, src, dst)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(pool, _copy_one, src, dst)
         logging.debug("Copied: %s -> %s", src, dst)
     except Exception as exc:
         logging.error("Failed to copy %s: %s", src, exc)
 
 
-async def copy_file(src_file: Path, out_root: Path) -> None:
-    """
-    Determine destination subfolder (by sanitized extension) and copy the file.
-    Numeric/invalid extensions are treated as no_extension.
-    """
-    subfolder = _extension_folder_name(src_file)
-    dst_dir = out_root / subfolder
-    await _copy_file_async(src_file, dst_dir)
-
-
 async def read_folder(
     source_root: Path,
     out_root: Path,
     *,
     include_exts: Optional[Iterable[str]] = None,
     max_concurrency: int = 64,
+    scan_workers: int = 8,
 ) -> None:
     """
     Recursively scan 'source_root', schedule async copies into 'out_root'
     grouping by (sanitized) extension.
 
+    The scan runs in background threads and feeds a queue that a fixed set
+    of 'max_concurrency' worker coroutines drains, so copying starts while
+    the tree is still being listed. Each destination subfolder is created
+    once, when its first file is found.
+
     Args:
         source_root: Directory to scan recursively.
         out_root: Destination directory root.
         include_exts: Optional set of allowed basic extensions (e.g., {".txt", ".md"}).
                       Comparison is case-insensitive and looks only at the last suffix.
-        max_concurrency: Limit for concurrent copy operations.
+        max_concurrency: Number of copy workers (coroutines and threads).
+        scan_workers: Number of threads listing directories.
     """
-    sem = asyncio.Semaphore(max_concurrency)
-    tasks: List[asyncio.Task] = []
-
     norm_exts: Optional[Set[str]] = None
     if include_exts:
         norm_exts = {e.lower() if e.startswith(".") else f".{e.lower()}" for e in include_exts}
 
-    for path in source_root.rglob("*"):
-        if not path.is_file():
-            continue
-        if _should_skip(path):
-            continue
-        if norm_exts and path.suffix.lower() not in norm_exts:
-            continue
-
-        async def _task(p: Path) -> None:
-            async with sem:
-                await copy_file(p, out_root)
-
-        tasks.append(asyncio.create_task(_task(path)))
-
-    if not tasks:
-        logging.info("No files found to process.")
-        return
+    loop = asyncio.get_running_loop()
+    out_root_str = os.path.abspath(out_root)
+    jobs: asyncio.Queue[Optional[Tuple[str, str]]] = asyncio.Queue()
+    subfolders: Set[str] = set()
+    lock = threading.Lock()
+    total = 0
+
+    def on_file(entry: os.DirEntry) -> None:
+        # Runs in scan threads: jobs are plain (src, dst) path strings.
+        # Numeric/invalid extensions are treated as no_extension.
+        nonlocal total
+        name = entry.name
+        if norm_exts and os.path.splitext(name)[1].lower() not in norm_exts:
+            return
+        subfolder = _extension_folder_name(name)
+        dst_dir = os.path.join(out_root_str, subfolder)
+        with lock:
+            if subfolder not in subfolders:
+                try:
+                    os.makedirs(dst_dir, exist_ok=True)
+                except OSError as exc:
+                    logging.error("Failed to create %s: %s", dst_dir, exc)
+                    return
+                subfolders.add(subfolder)
+            total += 1
+        loop.call_soon_threadsafe(jobs.put_nowait, (entry.path, os.path.join(dst_dir, name)))
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+
+        async def worker() -> None:
+            while True:
+                item = await jobs.get()
+                if item is None:
+                    return
+                await _copy_file_async(item[0], item[1], pool)
+
+        workers = [asyncio.create_task(worker()) for _ in range(max_concurrency)]
+        scan_stop = threading.Event()
+        try:
+            # Never list 'out_root' if it lies inside 'source_root': it is being
+            # filled while we scan, and its files would be copied onto themselves
+            await asyncio.to_thread(
+                _scan_tree,
+                source_root,
+                on_file,
+                scan_workers,
+                scan_stop,
+                frozenset({out_root_str}),
+            )
+        finally:
+            # Stops the scan threads if we were cancelled mid-scan
+            scan_stop.set()
+            for _ in workers:
+                jobs.put_nowait(None)
+
+        if total:
+            logging.info("Scheduled %d file(s) for copy.", total)
+        else:
+            logging.info("No files found to process.")
+        await asyncio.gather(*workers)
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create the event loop for the sorter.
 
-    logging.info("Scheduled %d file(s) for copy.", len(tasks))
-    await asyncio.gather(*tasks)
+    Uses uvloop when installed and, on Python 3.12+, the eager task factory so
+    tasks that finish without blocking skip a scheduler round-trip.
+    """
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        loop.set_task_factory(eager_task_factory)
+    return loop
 
 
 def parse_args() -> argparse.Namespace:
@@ -177,14 +397,23 @@ def main() -> None:
 
     dst.mkdir(parents=True, exist_ok=True)
 
-    loop = asyncio.new_event_loop()
+    loop = _new_event_loop()
     asyncio.set_event_loop(loop)
-    start = loop.time()
+    start = time.perf_counter()
+    main_task = loop.create_task(read_folder(src, dst, include_exts=None, max_concurrency=64))
     try:
-        loop.run_until_complete(read_folder(src, dst, include_exts=None, max_concurrency=64))
+        loop.run_until_complete(main_task)
     finally:
-        elapsed = loop.time() - start
+        # On Ctrl-C, unwind read_folder (like asyncio.run) so the scan stops
+        # and its thread pools shut down instead of blocking interpreter exit
+        if not main_task.done():
+            main_task.cancel()
+            loop.run_until_complete(asyncio.gather(main_task, return_exceptions=True))
+        # The scan runs via asyncio.to_thread on the default executor
+        loop.run_until_complete(loop.shutdown_default_executor())
+        elapsed = time.perf_counter() - start
         logging.info("Completed in %.3f s", elapsed)
+        asyncio.set_event_loop(None)
         loop.close()
 
 
@@ -1,3 +1,12 @@
+# Fully annotated so it can be compiled ahead of time: `mypyc task_2.py`
+
+import operator
+import re
+from typing import Callable, Dict, Final, Iterator, NoReturn, Optional, Union
+
+Number = Union[int, float]
+
+
 class LexicalError(Exception):
     """Виключення для помилок лексичного аналізу."""
 
@@ -13,88 +22,73 @@ class ParsingError(Exception):
 class TokenType:
     """Типи токенів для арифметичних операцій."""
 
-    INTEGER = "INTEGER"
-    PLUS = "PLUS"
-    MINUS = "MINUS"
-    MUL = "MUL"
-    DIV = "DIV"
-    LPAREN = "("
-    RPAREN = ")"
-    EOF = "EOF"
+    INTEGER: Final = "INTEGER"
+    PLUS: Final = "PLUS"
+    MINUS: Final = "MINUS"
+    MUL: Final = "MUL"
+    DIV: Final = "DIV"
+    LPAREN: Final = "("
+    RPAREN: Final = ")"
+    EOF: Final = "EOF"
 
 
 class Token:
     """Клас токена з типом i значенням."""
 
-    def __init__(self, type, value):
+    type: str
+    value: Optional[Union[int, str]]
+
+    def __init__(self, type: str, value: Optional[Union[int, str]]) -> None:
         self.type = type
         self.value = value
 
-    def __str__(self):
+    def __str__(self) -> str:
         return f"Token({self.type}, {repr(self.value)})"
 
 
+_TOKEN_RE: Final = re.compile(r"\s+|(?P<INT>\d+)|(?P<OP>[-+*/()])")
+
+_OP_TYPES: Final[Dict[str, str]] = {
+    "+": TokenType.PLUS,
+    "-": TokenType.MINUS,
+    "*": TokenType.MUL,
+    "/": TokenType.DIV,
+    "(": TokenType.LPAREN,
+    ")": TokenType.RPAREN,
+}
+
+
 class Lexer:
     """Лексичний аналізатор, що розбиває рядок на токени."""
 
-    def __init__(self, text):
+    text: str
+    pos: int
+    _matches: Iterator["re.Match[str]"]
+
+    def __init__(self, text: str) -> None:
         self.text = text
         self.pos = 0
-        self.current_char = self.text[self.pos] if self.text else None
-
-    def advance(self):
-        """Перехід до наступного символу y вхідному тексті."""
-        self.pos += 1
-        self.current_char = self.text[self.pos] if self.pos < len(self.text) else None
-
-    def skip_whitespace(self):
-        """Пропуск пробілів."""
-        while self.current_char is not None and self.current_char.isspace():
-            self.advance()
-
-    def integer(self):
-        """Зчитування цілого числа."""
-        result = ""
-        while self.current_char is not None and self.current_char.isdigit():
-            result += self.current_char
-            self.advance()
-        return int(result)
-
-    def get_next_token(self):
-        """Головний метод лексера для побудови токенів."""
-        while self.current_char is not None:
-            if self.current_char.isspace():
-                self.skip_whitespace()
-                continue
-
-            if self.current_char.isdigit():
-                return Token(TokenType.INTEGER, self.integer())
-
-            if self.current_char == "+":
-                self.advance()
-                return Token(TokenType.PLUS, "+")
+        self._matches = _TOKEN_RE.finditer(text)
 
-            if self.current_char == "-":
-                self.advance()
-                return Token(TokenType.MINUS, "-")
+    def error(self) -> NoReturn:
+        raise LexicalError(f"Невідомий символ: {self.text[self.pos]}")
 
-            if self.current_char == "*":
-                self.advance()
-                return Token(TokenType.MUL, "*")
-
-            if self.current_char == "/":
-                self.advance()
-                return Token(TokenType.DIV, "/")
+    def get_next_token(self) -> Token:
+        """Головний метод лексера для побудови токенів."""
+        for match in self._matches:
+            if match.start() != self.pos:
+                self.error()
+            self.pos = match.end()
 
-            if self.current_char == "(":
-                self.advance()
-                return Token(TokenType.LPAREN, "(")
+            if match.lastgroup == "INT":
+                return Token(TokenType.INTEGER, int(match.group()))
 
-            if self.current_char == ")":
-                self.advance()
-                return Token(TokenType.RPAREN, ")")
+            if match.lastgroup == "OP":
+                op = match.group()
+                return Token(_OP_TYPES[op], op)
 
-            raise LexicalError(f"Невідомий символ: {self.current_char}")
+        if self.pos < len(self.text):
+            self.error()
 
         return Token(TokenType.EOF, None)
 
@@ -108,7 +102,11 @@ class AST:
 class BinOp(AST):
     """Бінарна операція: лівий i правий вузол + оператор."""
 
-    def __init__(self, left, op, right):
+    left: AST
+    op: Token
+    right: AST
+
+    def __init__(self, left: AST, op: Token, right: AST) -> None:
         self.left = left
         self.op = op
         self.right = right
@@ -117,7 +115,11 @@ class BinOp(AST):
 class Num(AST):
     """Числовий вузол з токеном та значенням."""
 
-    def __init__(self, token):
+    token: Token
+    value: int
+
+    def __init__(self, token: Token) -> None:
+        assert isinstance(token.value, int)
         self.token = token
         self.value = token.value
 
@@ -125,21 +127,24 @@ class Num(AST):
 class Parser:
     """Парсер будує синтаксичне дерево з токенів."""
 
-    def __init__(self, lexer):
+    lexer: Lexer
+    current_token: Token
+
+    def __init__(self, lexer: Lexer) -> None:
         self.lexer = lexer
         self.current_token = self.lexer.get_next_token()
 
-    def error(self):
+    def error(self) -> NoReturn:
         raise ParsingError("Помилка синтаксичного аналізу")
 
-    def eat(self, token_type):
+    def eat(self, token_type: str) -> None:
         """Очікує певний тип токена й переходить до наступного."""
         if self.current_token.type == token_type:
             self.current_token = self.lexer.get_next_token()
         else:
             self.error()
 
-    def factor(self):
+    def factor(self) -> AST:
         """Фактор - це число чи вираз y дужках."""
         token = self.current_token
         if token.type == TokenType.INTEGER:
@@ -150,8 +155,9 @@ class Parser:
             node = self.expr()
             self.eat(TokenType.RPAREN)
             return node
+        self.error()
 
-    def term(self):
+    def term(self) -> AST:
         """Терм - це множення чи ділення факторів."""
         node = self.factor()
         while self.current_token.type in (TokenType.MUL, TokenType.DIV):
@@ -163,7 +169,7 @@ class Parser:
             node = BinOp(left=node, op=token, right=self.factor())
         return node
 
-    def expr(self):
+    def expr(self) -> AST:
         """Вираз - це додавання та віднімання термів."""
         node = self.term()
         while self.current_token.type in (TokenType.PLUS, TokenType.MINUS):
@@ -175,7 +181,7 @@ class Parser:
             node = BinOp(left=node, op=token, right=self.term())
         return node
 
-    def parse(self):
+    def parse(self) -> AST:
         """Починає парсинг i повертає кореневий вузол дерева."""
         node = self.expr()
         if self.current_token.type != TokenType.EOF:
@@ -183,42 +189,41 @@ class Parser:
         return node
 
 
+def _div(left: Number, right: Number) -> float:
+    if right == 0:
+        raise ZeroDivisionError("Ділення на нуль")
+    return left / right
+
+
+_OPS: Final[Dict[str, Callable[[Number, Number], Number]]] = {
+    TokenType.PLUS: operator.add,
+    TokenType.MINUS: operator.sub,
+    TokenType.MUL: operator.mul,
+    TokenType.DIV: _div,
+}
+
+
 class Interpreter:
     """Інтерпретатор, що обходить дерево i обчислює значення виразу."""
 
-    def __init__(self, parser):
+    parser: Parser
+
+    def __init__(self, parser: Parser) -> None:
         self.parser = parser
 
-    def visit(self, node):
-        method_name = "visit_" + type(node).__name__
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
-
-    def generic_visit(self, node):
-        raise Exception(f"Немає методу visit_{type(node).__name__}")
-
-    def visit_BinOp(self, node):
-        if node.op.type == TokenType.PLUS:
-            return self.visit(node.left) + self.visit(node.right)
-        elif node.op.type == TokenType.MINUS:
-            return self.visit(node.left) - self.visit(node.right)
-        elif node.op.type == TokenType.MUL:
-            return self.visit(node.left) * self.visit(node.right)
-        elif node.op.type == TokenType.DIV:
-            right_val = self.visit(node.right)
-            if right_val == 0:
-                raise ZeroDivisionError("Ділення на нуль")
-            return self.visit(node.left) / right_val
-
-    def visit_Num(self, node):
-        return node.value
-
-    def interpret(self):
+    def visit(self, node: AST) -> Number:
+        if isinstance(node, Num):
+            return node.value
+        if isinstance(node, BinOp):
+            return _OPS[node.op.type](self.visit(node.left), self.visit(node.right))
+        raise Exception(f"Невідомий вузол: {type(node).__name__}")
+
+    def interpret(self) -> Number:
         tree = self.parser.parse()
         return self.visit(tree)
 
 
-def main():
+def main() -> None:
     while True:
         try:
             text = input("Введіть вираз (чи 'exit'): ")
@@ -1,101 +1,168 @@
 """
 MapReduce Word Frequency Analyzer
 
-- Downloads text from a given URL.
-- Splits the text into chunks for parallel processing (Map phase).
-- Groups intermediate results (Shuffle & Sort phase).
-- Aggregates word counts (Reduce phase).
+- Streams text from a given URL and counts words chunk by chunk as it downloads
+  (MapReduce.run_stream): each chunk is mapped to word counts and merged into
+  the running total; this is the path used by the script.
+- For text already in memory, MapReduce.run splits large texts into chunks
+  counted in worker processes (Map phase) and merges the counts (Reduce phase).
 - Visualizes the top N most frequent words in a horizontal bar chart.
 """
 
 from __future__ import annotations
 
 import re
-import requests
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List, Tuple
+import httpx
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from heapq import nlargest
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List
 
 import matplotlib.pyplot as plt
 
+# Word tokenizer shared by all phases
+_WORD_RE = re.compile(r"\b\w+\b")
+
+# Same tokenizer for ASCII-only text (bytes \w is [a-zA-Z0-9_])
+_WORD_RE_BYTES = re.compile(rb"\w+")
+
+# Everything up to the last non-word character of a streamed chunk; the
+# greedy prefix backtracks from the end, so cost is linear in the tail
+_HEAD_RE = re.compile(r"(?s).*\W")
+
+# Any non-word character is a safe chunk boundary (never splits a word)
+_BOUNDARY_RE = re.compile(r"\W")
+
+# Texts up to this many characters are counted in a single pass
+_PARALLEL_THRESHOLD = 1_000_000
+
+# Download chunk size for streamed responses
+_STREAM_CHUNK_SIZE = 65536
+
+
+def _count_words(text: str) -> Counter:
+    """
+    Count lowercased words in text.
+
+    ASCII-only text takes a bytes fast path (bytes regex and bytes.lower);
+    keys are decoded back to str once per unique word.
+    """
+    if text.isascii():
+        counts = Counter(_WORD_RE_BYTES.findall(text.encode("ascii").lower()))
+        return Counter({word.decode("ascii"): n for word, n in counts.items()})
+    return Counter(_WORD_RE.findall(text.lower()))
+
 
 class MapReduce:
     """Simple MapReduce implementation for word frequency analysis."""
 
     def __init__(self, num_mappers: int = 4, num_reducers: int = 2) -> None:
         self.num_mappers = num_mappers
+        # Kept for API compatibility: partial counts are merged in the driver
         self.num_reducers = num_reducers
 
     @staticmethod
-    def _map(text_chunk: str) -> List[Tuple[str, int]]:
-        """Map phase: Extract words and emit (word, 1) pairs."""
-        words = re.findall(r"\b\w+\b", text_chunk.lower())
-        return [(word, 1) for word in words]
+    def _map(text_chunk: str) -> Counter:
+        """Map phase: Count words in a single chunk."""
+        return _count_words(text_chunk)
 
-    @staticmethod
-    def _shuffle_and_sort(mapped_values: List[Tuple[str, int]]) -> Dict[str, List[int]]:
-        """Shuffle & Sort phase: Group values by key."""
-        shuffled: Dict[str, List[int]] = defaultdict(list)
-        for key, value in mapped_values:
-            shuffled[key].append(value)
-        return shuffled
+    def _split(self, text: str) -> List[str]:
+        """Split text into roughly equal chunks without cutting words in half."""
+        chunk_size = max(1, (len(text) + self.num_mappers - 1) // self.num_mappers)
+        chunks: List[str] = []
+        start = 0
+        while start < len(text):
+            # Move the cut forward to the next non-word character
+            match = _BOUNDARY_RE.search(text, start + chunk_size)
+            end = match.start() if match else len(text)
+            chunks.append(text[start:end])
+            start = end
+        return chunks
+
+    def run(self, text: str) -> Dict[str, int]:
+        """
+        Run MapReduce on the given text.
+
+        Short texts are counted directly with a single Counter pass; above
+        _PARALLEL_THRESHOLD characters the text is split into chunks that
+        are counted in worker processes and merged.
+        """
+        if len(text) <= _PARALLEL_THRESHOLD:
+            return dict(_count_words(text))
+
+        # Map phase (parallel), Reduce phase merges partial counts
+        total: Counter = Counter()
+        with ProcessPoolExecutor(max_workers=self.num_mappers) as mapper_pool:
+            for partial in mapper_pool.map(self._map, self._split(text)):
+                total.update(partial)
+
+        return dict(total)
 
     @staticmethod
-    def _reduce(key: str, values: List[int]) -> Tuple[str, int]:
-        """Reduce phase: Sum values for a given key."""
-        return key, sum(values)
+    def run_stream(chunks: Iterable[str]) -> Dict[str, int]:
+        """
+        Count words incrementally over a stream of text chunks.
+
+        A word cut at the end of one chunk is carried over to the next one,
+        so only about one chunk is held in memory at a time.
+        """
+        total: Counter = Counter()
+        carry = ""
+        for chunk in chunks:
+            buf = carry + chunk
+            head = _HEAD_RE.match(buf)
+            if head:
+                carry = buf[head.end():]
+                buf = buf[:head.end()]
+            else:
+                carry, buf = buf, ""
+            total.update(_count_words(buf))
+        total.update(_count_words(carry))
+        return dict(total)
+
+
+def _make_http_client() -> httpx.Client:
+    """Create a keep-alive HTTP client, using HTTP/2 when 'h2' is installed."""
+    try:
+        return httpx.Client(http2=True, timeout=10, follow_redirects=True)
+    except ImportError:
+        return httpx.Client(timeout=10, follow_redirects=True)
 
-    def run(self, text: str) -> Dict[str, int]:
-        """Run MapReduce on the given text."""
-        # Split text into chunks for mappers
-        chunk_size = max(1, (len(text) + self.num_mappers - 1) // self.num_mappers)
-        chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
-
-        # Map phase (parallel)
-        mapped_results: List[Tuple[str, int]] = []
-        with ThreadPoolExecutor(max_workers=self.num_mappers) as mapper_pool:
-            for result in mapper_pool.map(self._map, chunks):
-                mapped_results.extend(result)
-
-        # Shuffle & Sort phase
-        shuffled_data = self._shuffle_and_sort(mapped_results)
-
-        # Assign keys to reducers
-        reducer_assignments: Dict[int, List[str]] = defaultdict(list)
-        for i, key in enumerate(shuffled_data.keys()):
-            reducer_assignments[i % self.num_reducers].append(key)
-
-        # Reduce phase (parallel)
-        reduced_results: Dict[str, int] = {}
-        with ThreadPoolExecutor(max_workers=self.num_reducers) as reducer_pool:
-            futures = []
-            for reducer_id, keys in reducer_assignments.items():
-                for key in keys:
-                    futures.append(
-                        reducer_pool.submit(self._reduce, key, shuffled_data[key])
-                    )
-            for future in futures:
-                k, v = future.result()
-                reduced_results[k] = v
-
-        return reduced_results
+
+# Shared client: connections (and TLS sessions) are reused across fetches
+_HTTP = _make_http_client()
+
+# Download failures; InvalidURL does not subclass httpx.HTTPError
+_HTTP_ERRORS = (httpx.HTTPError, httpx.InvalidURL)
 
 
 def fetch_text_from_url(url: str) -> str:
     """Download text content from a given URL."""
     try:
-        response = requests.get(url, timeout=10)
+        response = _HTTP.get(url)
         response.raise_for_status()
         return response.text
-    except requests.exceptions.RequestException as exc:
+    except _HTTP_ERRORS as exc:
         print(f"[ERROR] Failed to download text from {url}: {exc}")
         return ""
 
 
+def stream_text_from_url(url: str, chunk_size: int = _STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Download text content from a given URL, yielding decoded chunks.
+
+    Transport errors are not swallowed: a failure after some chunks were
+    yielded would otherwise look like a complete (but shorter) text.
+    """
+    with _HTTP.stream("GET", url) as response:
+        response.raise_for_status()
+        yield from response.iter_text(chunk_size=chunk_size)
+
+
 def visualize_top_words(word_counts: Dict[str, int], top_n: int = 10) -> None:
     """Display the top N words in a horizontal bar chart."""
-    sorted_words = sorted(word_counts.items(), key=lambda item: item[1], reverse=True)
-    top_words = sorted_words[:top_n]
+    top_words = nlargest(top_n, word_counts.items(), key=itemgetter(1))
 
     words = [word for word, _ in top_words]
     counts = [count for _, count in top_words]
@@ -113,14 +180,15 @@ if __name__ == "__main__":
     # Example URL
     url = "https://raw.githubusercontent.com/dscape/spell/master/test/resources/big.txt"
 
-    print(f"[INFO] Downloading text from {url}...")
-    text_data = fetch_text_from_url(url)
-
-    if text_data:
-        print("[INFO] Running MapReduce word frequency analysis...")
-        mr = MapReduce(num_mappers=4, num_reducers=2)
-        frequencies = mr.run(text_data)
+    print(f"[INFO] Downloading and analyzing text from {url}...")
+    try:
+        frequencies = MapReduce.run_stream(stream_text_from_url(url))
+    except _HTTP_ERRORS as exc:
+        # All-or-nothing: never visualize counts from a partial download
+        print(f"[ERROR] Failed to download text from {url}: {exc}")
+        frequencies = {}
 
+    if frequencies:
         print("[INFO] Visualization...")
         visualize_top_words(frequencies, top_n=10)
     else: